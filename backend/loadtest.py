@@ -0,0 +1,168 @@
+"""
+Measures how /upload parse throughput scales with the number of workers.
+
+For each worker count a server is started through `parse_only_app`, polled
+on /ready, hit with concurrent PDF uploads, then stopped with SIGTERM. Auth,
+client setup, network warmup and ingestion are stubbed out inside the
+workers, so the numbers reflect the GIL-bound PDF parse rather than
+Supabase/Gemini latency, and no credentials are needed or data written.
+
+Usage:
+    python loadtest.py --workers 1 2 4
+    python loadtest.py --file sample.pdf --workers 1 2 4 --concurrency 16
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def parse_only_app():
+    """
+    Uvicorn app factory, called in each worker: the real app with everything
+    but the text extraction in /upload stubbed out.
+    """
+    import main
+    import rag
+
+    rag.init_clients = lambda: None
+    rag.warmup = rag.warm_parsers
+    main.app.dependency_overrides[main.get_current_user] = lambda: "loadtest-user"
+    main.rag_service.ingest_file = lambda user_id, filename, content: {
+        "status": "success",
+        "characters": len(content)
+    }
+    return main.app
+
+def build_sample_pdf(pages: int = 40, lines_per_page: int = 50) -> bytes:
+    """
+    Writes a text-heavy PDF by hand so the benchmark needs no fixture file.
+    """
+    line = "Cortex load test: quarterly revenue grew while operating costs held steady across regions"
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    for i in range(pages):
+        page_id, content_id = 4 + 2 * i, 5 + 2 * i
+        kids.append(f"{page_id} 0 R")
+        stream = "BT /F1 9 Tf 11 TL 40 760 Td " + " ".join(
+            f"({line} {i}.{n}) '" for n in range(lines_per_page)
+        ) + " ET"
+        objects[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        objects[content_id] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += f"{obj_id} 0 obj\n{objects[obj_id]}\nendobj\n".encode("latin-1")
+
+    xref_offset = len(out)
+    size = max(objects) + 1
+    out += f"xref\n0 {size}\n0000000000 65535 f \n".encode()
+    for obj_id in range(1, size):
+        out += f"{offsets[obj_id]:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return bytes(out)
+
+def wait_until_ready(server: subprocess.Popen, base_url: str, timeout: float = 120):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode} before becoming ready")
+        try:
+            if requests.get(f"{base_url}/ready", timeout=2).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} did not become ready within {timeout}s")
+
+def run_load(base_url: str, filename: str, payload: bytes, total: int, concurrency: int):
+    def upload(_):
+        start = time.perf_counter()
+        try:
+            resp = requests.post(
+                f"{base_url}/upload",
+                files={"file": (filename, payload)},
+                timeout=600,
+            )
+            ok = resp.status_code == 200
+        except requests.RequestException as e:
+            print(f"Request failed: {e}")
+            ok = False
+        return ok, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(upload, range(total)))
+    elapsed = time.perf_counter() - start
+
+    # Failed requests are often fast (4xx/5xx) and would inflate req/s
+    latencies = sorted(latency for ok, latency in results if ok)
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50": latencies[len(latencies) // 2] if latencies else float("nan"),
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else float("nan"),
+        "failures": total - len(latencies),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="PDF to upload (default: a generated text-heavy PDF)")
+    parser.add_argument("--pages", type=int, default=40, help="Pages in the generated PDF")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--requests", type=int, default=64, help="Uploads per worker count")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "rb") as f:
+            payload = f.read()
+        filename = os.path.basename(args.file)
+    else:
+        payload = build_sample_pdf(args.pages)
+        filename = "loadtest.pdf"
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    print(f"CPUs available: {os.cpu_count()}")
+    rows = []
+    for workers in args.workers:
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "loadtest:parse_only_app", "--factory",
+                "--workers", str(workers), "--host", "127.0.0.1", "--port", str(args.port),
+                "--log-level", "warning",
+            ],
+            cwd=BACKEND_DIR,
+        )
+        try:
+            wait_until_ready(server, base_url)
+            stats = run_load(base_url, filename, payload, args.requests, args.concurrency)
+            rows.append((workers, stats))
+            print(f"workers={workers}: {stats['throughput']:.2f} req/s")
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait()
+
+    baseline = rows[0][1]["throughput"] if rows else 0
+    print(f"\n{'workers':>7} {'req/s':>8} {'speedup':>8} {'p50 (s)':>8} {'p95 (s)':>8} {'failed':>7}")
+    for workers, stats in rows:
+        speedup = stats["throughput"] / baseline if baseline else 0
+        print(f"{workers:>7} {stats['throughput']:>8.2f} {speedup:>7.2f}x {stats['p50']:>8.2f} {stats['p95']:>8.2f} {stats['failures']:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
 from typing import Optional
+import rag
 from rag import rag_service
-from supabase import create_client, Client
 import os
 import io
 from pypdf import PdfReader
@@ -11,7 +13,25 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-app = FastAPI(title="Cortex Enterprise API")
+# Serving configuration (see __main__ below)
+HOST = os.getenv("CORTEX_HOST", "0.0.0.0")
+PORT = int(os.getenv("CORTEX_PORT", "8000"))
+WORKERS = int(os.getenv("CORTEX_WORKERS", "1"))
+# Ingests sleep 0.5s per chunk plus embed/insert round-trips (~1s per 800
+# chars), so a 40-page PDF needs roughly two minutes to finish
+DRAIN_TIMEOUT = int(os.getenv("CORTEX_DRAIN_TIMEOUT", "300"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs once in every worker process. Uvicorn only starts accepting
+    # connections on this worker after it returns, so a cold worker never
+    # serves traffic.
+    rag.init_clients()
+    await run_in_threadpool(rag.warmup)
+    print(f"Worker {os.getpid()} ready")
+    yield
+
+app = FastAPI(title="Cortex Enterprise API", lifespan=lifespan)
 
 # Setup CORS
 app.add_middleware(
@@ -22,12 +42,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize Supabase for Auth Verification
-supabase: Client = create_client(
-    os.getenv("SUPABASE_URL"),
-    os.getenv("SUPABASE_KEY")
-)
-
 # Dependency: Verify JWT Token and return User ID
 def get_current_user(authorization: Optional[str] = Header(None)):
     if not authorization:
@@ -36,7 +50,7 @@ def get_current_user(authorization: Optional[str] = Header(None)):
     try:
         # Expected format: "Bearer <token>"
         token = authorization.split(" ")[1]
-        user = supabase.auth.get_user(token)
+        user = rag.supabase.auth.get_user(token)
         
         if not user or not user.user:
              raise HTTPException(status_code=401, detail="Invalid Authentication Token")
@@ -56,6 +70,51 @@ class UrlRequest(BaseModel):
 def read_root():
     return {"status": "Cortex Neural Link Active"}
 
+@app.get("/ready")
+def readiness():
+    # Only reachable once warmup has finished (see lifespan); a refused or
+    # timed-out connection means no worker is ready.
+    return {"status": "ready"}
+
+def extract_text(filename: str, content_bytes: bytes) -> str:
+    text_content = ""
+
+    # Handle PDF Files
+    if filename.endswith(".pdf"):
+        try:
+            pdf_file = io.BytesIO(content_bytes)
+            reader = PdfReader(pdf_file)
+            for page in reader.pages:
+                extract = page.extract_text()
+                if extract:
+                    text_content += extract + "\n"
+        except Exception as e:
+            print(f"PDF Parse Error: {e}")
+            raise HTTPException(status_code=400, detail="Failed to parse PDF file. Ensure it is not corrupted or password protected.")
+
+    # Handle Text/Code Files
+    else:
+        try:
+            text_content = content_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            # Fallback for older encodings
+            try:
+                text_content = content_bytes.decode("latin-1")
+            except Exception:
+                raise HTTPException(status_code=400, detail="File encoding not supported. Please upload UTF-8 text or PDF.")
+
+    if not text_content.strip():
+         raise HTTPException(status_code=400, detail="File is empty or could not extract readable text.")
+
+    return text_content
+
+def ingest_upload(user_id: str, filename: str, content_bytes: bytes):
+    # Runs in the threadpool so parsing never blocks the event loop
+    text_content = extract_text(filename.lower(), content_bytes)
+
+    # Send to RAG Engine
+    return rag_service.ingest_file(user_id, filename, text_content)
+
 @app.post("/upload")
 async def upload_document(
     file: UploadFile = File(...), 
@@ -63,38 +122,9 @@ async def upload_document(
 ):
     try:
         content_bytes = await file.read()
-        filename = file.filename.lower() if file.filename else "unknown"
-        text_content = ""
-
-        # Handle PDF Files
-        if filename.endswith(".pdf"):
-            try:
-                pdf_file = io.BytesIO(content_bytes)
-                reader = PdfReader(pdf_file)
-                for page in reader.pages:
-                    extract = page.extract_text()
-                    if extract:
-                        text_content += extract + "\n"
-            except Exception as e:
-                print(f"PDF Parse Error: {e}")
-                raise HTTPException(status_code=400, detail="Failed to parse PDF file. Ensure it is not corrupted or password protected.")
-        
-        # Handle Text/Code Files
-        else:
-            try:
-                text_content = content_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                # Fallback for older encodings
-                try:
-                    text_content = content_bytes.decode("latin-1")
-                except Exception:
-                    raise HTTPException(status_code=400, detail="File encoding not supported. Please upload UTF-8 text or PDF.")
-
-        if not text_content.strip():
-             raise HTTPException(status_code=400, detail="File is empty or could not extract readable text.")
-
-        # Send to RAG Engine
-        return rag_service.ingest_file(user_id, file.filename or "uploaded_file", text_content)
+        return await run_in_threadpool(
+            ingest_upload, user_id, file.filename or "uploaded_file", content_bytes
+        )
 
     except HTTPException as he:
         raise he
@@ -126,4 +156,15 @@ def chat_endpoint(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # An import string is required for workers > 1; each worker imports the
+    # app itself and runs lifespan (client setup + warmup) on its own.
+    # On SIGTERM uvicorn stops accepting, waits up to DRAIN_TIMEOUT for
+    # in-flight uploads/crawls to respond, then cancels what is left.
+    uvicorn.run(
+        "main:app",
+        host=HOST,
+        port=PORT,
+        workers=WORKERS,
+        timeout_graceful_shutdown=DRAIN_TIMEOUT,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+    )
\ No newline at end of file
@@ -6,6 +6,7 @@ from dotenv import load_dotenv
 import requests
 from bs4 import BeautifulSoup
 import time
+import threading
 
 load_dotenv()
 
@@ -15,13 +16,90 @@ SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
+# Upper bound on connection priming during worker warmup (seconds)
+PRIME_TIMEOUT = 5
+
 if not all([SUPABASE_URL, SUPABASE_KEY, GOOGLE_API_KEY, GROQ_API_KEY]):
     print("Error: Missing environment variables. Please check backend/.env")
 
-# Initialize Clients
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-genai.configure(api_key=GOOGLE_API_KEY)
-groq_client = Groq(api_key=GROQ_API_KEY)
+# Clients are created per process by init_clients(). Under a multi-worker
+# server each worker must own its own connection pools, so nothing network
+# facing is built at import time.
+supabase: Client = None
+groq_client: Groq = None
+
+def init_clients():
+    """
+    Builds the Supabase, Gemini and Groq clients for the current process.
+    """
+    global supabase, groq_client
+
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+    genai.configure(api_key=GOOGLE_API_KEY)
+    groq_client = Groq(api_key=GROQ_API_KEY)
+
+def warm_parsers():
+    """
+    Loads the modules pypdf and bs4 import lazily on their first parse.
+    """
+    import io
+    from pypdf import PdfReader, PdfWriter
+
+    # Round-trip a blank page so pypdf loads its reader/filter modules
+    buffer = io.BytesIO()
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    writer.write(buffer)
+    for page in PdfReader(io.BytesIO(buffer.getvalue())).pages:
+        page.extract_text()
+
+    BeautifulSoup("<html><head><title>warmup</title></head><body></body></html>", 'html.parser').get_text()
+
+def prime_connections(timeout: float = PRIME_TIMEOUT):
+    """
+    Opens each client's connection with one cheap call. Best effort: calls
+    run in parallel without retries and are abandoned after `timeout`, so a
+    slow upstream cannot hold up worker startup.
+    """
+    primers = {
+        "supabase": lambda: supabase.table("documents").select("id").limit(1).execute(),
+        # embed_content goes through the same channel get_embedding uses
+        "gemini": lambda: genai.embed_content(
+            model=rag_service.embedding_model,
+            content="warmup",
+            task_type="retrieval_query",
+            request_options={"timeout": timeout, "retry": None}
+        ),
+        "groq": lambda: groq_client.with_options(timeout=timeout, max_retries=0).models.list(),
+    }
+
+    def run(name, prime):
+        try:
+            prime()
+        except Exception as e:
+            print(f"Warmup: could not prime {name} connection: {e}")
+
+    # Daemon threads so a hung call never blocks interpreter exit
+    threads = {
+        name: threading.Thread(target=run, args=(name, prime), daemon=True)
+        for name, prime in primers.items()
+    }
+    for thread in threads.values():
+        thread.start()
+
+    deadline = time.monotonic() + timeout
+    for name, thread in threads.items():
+        thread.join(max(0, deadline - time.monotonic()))
+        if thread.is_alive():
+            print(f"Warmup: {name} did not respond within {timeout}s, continuing without it")
+
+def warmup():
+    """
+    Pays first-request costs up front: lazy imports inside the parsers and
+    the TLS handshakes of each client's connection pool.
+    """
+    warm_parsers()
+    prime_connections()
 
 class RAGService:
     def __init__(self):